@@ -9,19 +9,152 @@ outdated pricing information to help maintain accurate cost tracking.
 Generated with assistance from aider.chat
 """
 
+import hashlib
+import json
+import os
+import pickle
 import sys
+import tempfile
+import threading
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-import requests
-import yaml
+from typing import Callable, Dict, Iterator, List, Optional, Any, Set, Tuple
 import click
 from loguru import logger
 
+from openrouter_pricing import compare_pricing
+
+# requests and yaml are imported inside the functions that need them so that
+# --help and argument errors don't pay for their import time
+
+# Shared HTTP session so repeated API calls reuse pooled connections, created
+# on first use by _get_session
+_SESSION: Optional[Any] = None
+
+# Directory holding pickled parses of config files, keyed by path and checked
+# against a hash of their content, and the last OpenRouter API response along
+# with its validators
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "litellm_pricecheck"
+)
+_OPENROUTER_CACHE = _CACHE_DIR / "openrouter.pkl"
+
+# Fixed pickle protocol so interpreters down to Python 3.7 can share the cache
+_PICKLE_PROTOCOL = 4
+
+# Prefix of LiteLLM model IDs routed through OpenRouter
+_OPENROUTER_PREFIX = "openrouter/"
+
+
+def _get_session() -> Any:
+    """
+    Return the shared requests session, creating it on first use.
+
+    requests negotiates gzip by default, and brotli when the brotli package is
+    installed, which shrinks the OpenRouter model list considerably.
+
+    Returns
+    -------
+    requests.Session
+        The module-wide HTTP session
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _SESSION = requests.Session()
+        _SESSION.headers["Accept"] = "application/json"
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return _SESSION
+
+
+def _read_cache(cache_path: Path) -> Optional[Any]:
+    """
+    Load a pickled object from the cache directory.
+
+    Parameters
+    ----------
+    cache_path : Path
+        Path to the pickle file
+
+    Returns
+    -------
+    Optional[Any]
+        The cached object, or None if missing or unreadable
+    """
+    # The cache is only an optimization, so any failure to load it, including
+    # pickles from an incompatible Python version, counts as a miss
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception as e:
+        if not isinstance(e, FileNotFoundError):
+            logger.debug(f"Ignoring unreadable cache file {cache_path}: {e}")
+        return None
+
+
+def _write_cache(cache_path: Path, data: bytes) -> None:
+    """
+    Atomically write bytes to a file in the cache directory.
+
+    The data is written to a temporary file then renamed so concurrent runs
+    never see a partially written entry. Failures are logged and ignored since
+    the cache is only an optimization.
+
+    Parameters
+    ----------
+    cache_path : Path
+        Destination path inside the cache directory
+    data : bytes
+        Content to write
+    """
+    tmp_path = None
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write cache file {cache_path}: {e}")
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _config_cache_path(config_file: Path) -> Path:
+    """
+    Compute the cache file path for a parsed config file.
+
+    The name only depends on the resolved path, so each new version of a
+    config replaces the previous cache entry instead of adding another one.
+
+    Parameters
+    ----------
+    config_file : Path
+        Path to the YAML configuration file
+
+    Returns
+    -------
+    Path
+        Location of the pickled parse of the file
+    """
+    key = str(config_file.resolve())
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return _CACHE_DIR / f"{digest}.pkl"
+
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load YAML configuration file.
 
+    Parsed configs are cached on disk along with a hash of the file content,
+    and reused as long as the content is unchanged.
+
     Parameters
     ----------
     config_path : str
@@ -39,21 +172,51 @@ def load_config(config_path: str) -> Dict[str, Any]:
     yaml.YAMLError
         If config file is invalid YAML
     """
+    import yaml
+
+    # Prefer the libyaml-backed loader, which is much faster than the pure Python one
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader  # type: ignore[assignment]
+
     config_file = Path(config_path)
     if not config_file.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
+    # Hashing the raw bytes is far cheaper than parsing them, and unlike
+    # mtime/size it catches same-length edits that kept the old mtime
+    content = config_file.read_bytes()
+    content_digest = hashlib.sha256(content).hexdigest()
+
+    cache_path = _config_cache_path(config_file)
+    cached = _read_cache(cache_path)
+    if isinstance(cached, dict) and cached.get("digest") == content_digest:
+        return cached["config"]
+
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        config = yaml.load(content, Loader=SafeLoader)
     except yaml.YAMLError as e:
         raise yaml.YAMLError(f"Invalid YAML in config file: {e}")
 
+    _write_cache(
+        cache_path,
+        pickle.dumps(
+            {"digest": content_digest, "config": config},
+            protocol=_PICKLE_PROTOCOL,
+        ),
+    )
+    return config
+
 
 def fetch_openrouter_models() -> Dict[str, Dict[str, Any]]:
     """
     Fetch model pricing data from OpenRouter API.
 
+    The parsed response is cached on disk along with its ETag and
+    Last-Modified headers. Subsequent calls send a conditional request and
+    reuse the cached models when the API answers 304 Not Modified.
+
     Returns
     -------
     Dict[str, Dict[str, Any]]
@@ -64,17 +227,59 @@ def fetch_openrouter_models() -> Dict[str, Dict[str, Any]]:
     requests.RequestException
         If API request fails
     """
+    import requests
+
+    # orjson is optional but decodes the OpenRouter model list much faster
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads  # type: ignore[assignment]
+
     url = "https://openrouter.ai/api/v1/models"
 
+    # The validators and the models they belong to are stored in one pickle so
+    # they can never come from two different responses
+    headers = {}
+    cached_models = None
+    cached = _read_cache(_OPENROUTER_CACHE)
+    if isinstance(cached, dict) and cached.get("models") is not None:
+        cached_models = cached["models"]
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        response = requests.get(url, timeout=30)
+        response = _get_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
-        data = response.json()
 
-        # Create a lookup dictionary by model ID
-        models = {}
-        for model in data.get("data", []):
-            models[model["id"]] = model
+        if response.status_code == 304 and cached_models is not None:
+            logger.info(
+                f"OpenRouter models unchanged, using {len(cached_models)} cached models"
+            )
+            return cached_models
+
+        # Decode errors are reported like any other failed request, as
+        # response.json() used to do
+        try:
+            data = json_loads(response.content)
+        except ValueError as e:
+            raise requests.RequestException(f"Invalid JSON response: {e}")
+
+        # Create a lookup dictionary by model ID, extracting the IDs in C
+        entries = data.get("data") or []
+        models = dict(zip(map(itemgetter("id"), entries), entries))
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _write_cache(
+                _OPENROUTER_CACHE,
+                pickle.dumps(
+                    {"etag": etag, "last_modified": last_modified, "models": models},
+                    protocol=_PICKLE_PROTOCOL,
+                ),
+            )
 
         logger.info(f"Fetched {len(models)} models from OpenRouter API")
         return models
@@ -83,235 +288,249 @@ def fetch_openrouter_models() -> Dict[str, Dict[str, Any]]:
         raise requests.RequestException(f"Failed to fetch OpenRouter models: {e}")
 
 
-def extract_openrouter_models(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+def iter_openrouter_models(
+    config: Dict[str, Any],
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any], str]]:
     """
-    Extract models that use OpenRouter from the config.
+    Iterate over the models that use OpenRouter in the config.
 
     Parameters
     ----------
     config : Dict[str, Any]
         Configuration data
 
-    Returns
-    -------
-    List[Dict[str, Any]]
-        List of model configurations that use OpenRouter
+    Yields
+    ------
+    Tuple[Dict[str, Any], Dict[str, Any], str]
+        Tuple of (model configuration, its litellm_params, its model ID) for
+        each model that uses OpenRouter
     """
-    openrouter_models = []
-
-    for model in config.get("model_list", []):
-        litellm_params = model.get("litellm_params", {})
+    for model in config.get("model_list") or ():
+        litellm_params = model.get("litellm_params") or {}
         model_id = litellm_params.get("model", "")
+        if model_id.startswith(_OPENROUTER_PREFIX):
+            yield model, litellm_params, model_id
 
-        if model_id.startswith("openrouter/"):
-            openrouter_models.append(model)
-
-    logger.info(f"Found {len(openrouter_models)} OpenRouter models in config")
-    return openrouter_models
 
-
-def compare_pricing(
-    local_model: Dict[str, Any],
-    api_model: Dict[str, Any],
+def build_pricing_report(
+    config: Dict[str, Any],
+    api_models: Dict[str, Dict[str, Any]],
     cache_as_warnings: bool = False,
-) -> Tuple[List[str], List[str]]:
+    on_model: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
     """
-    Compare local model pricing with API pricing.
+    Check pricing for all OpenRouter models in config against API data.
 
     Parameters
     ----------
-    local_model : Dict[str, Any]
-        Local model configuration
-    api_model : Dict[str, Any]
+    config : Dict[str, Any]
+        Configuration data
+    api_models : Dict[str, Dict[str, Any]]
         Model data from OpenRouter API
     cache_as_warnings : bool, optional
         If True, treat cache-related pricing differences as warnings instead of errors.
         Default is False.
+    on_model : Optional[Callable[[Dict[str, Any]], None]], optional
+        Called with each model's result as soon as it is checked. The result
+        holds the model's name, model IDs, whether it was found in the API and
+        its discrepancies and warnings. Default is None.
 
     Returns
     -------
-    Tuple[List[str], List[str]]
-        Tuple of (discrepancies, warnings) found
+    Dict[str, Any]
+        Recap with the number of models checked, the names of models with
+        issues or warnings and the total counts of both
     """
-    discrepancies = []
-    warnings = []
-    litellm_params = local_model.get("litellm_params", {})
-    api_pricing = api_model.get("pricing", {})
-
-    # Mapping of local keys to API keys
-    price_mappings = {
-        "input_cost_per_token": "prompt",
-        "output_cost_per_token": "completion",
-        "cache_creation_input_token_cost": "input_cache_write",
-        "cache_read_input_token_cost": "input_cache_read",
-        "input_cost_per_image": "image",
-        "output_cost_per_reasoning_token": "internal_reasoning",
-    }
+    total_models = 0
+    total_issues = 0
+    total_warnings = 0
+    models_with_issues: Set[str] = set()
+    models_with_warnings: Set[str] = set()
 
-    for local_key, api_key in price_mappings.items():
-        local_value = litellm_params.get(local_key)
-        api_value = api_pricing.get(api_key)
+    for model, _, model_id in iter_openrouter_models(config):
+        total_models += 1
+        model_name = model.get("model_name", "Unknown")
 
-        if local_value is None:
-            if api_value and float(api_value) > 0:
-                discrepancies.append(f"Missing {local_key}: should be {api_value}")
-        else:
-            if api_value is None:
-                discrepancies.append(
-                    f"{local_key} set to {local_value} but API has no {api_key}"
-                )
-            else:
-                local_float = float(local_value)
-                api_float = float(api_value)
-
-                # Compare with small tolerance for floating point precision
-                if abs(local_float - api_float) > 1e-10:
-                    discrepancies.append(
-                        f"{local_key} mismatch: local={local_value}, API={api_value}"
-                    )
-
-    # Create reverse mapping to check for unmapped API keys
-    api_to_local_mappings = {v: k for k, v in price_mappings.items()}
-
-    # Define pricing keys that generate warnings instead of discrepancies
-    # These are not tracked by LiteLLM as of September 2025
-    warning_keys = {"web_search"}
-
-    # Cache-related API keys that can optionally be treated as warnings
-    cache_api_keys = {"input_cache_write", "input_cache_read"}
-
-    # If cache_as_warnings is enabled, add cache keys to warning_keys
-    if cache_as_warnings:
-        warning_keys.update(cache_api_keys)
-
-    # Check for API pricing keys that have non-zero values but are missing from config
-    for api_key, api_value in api_pricing.items():
-        if api_value and float(api_value) > 0:
-            if api_key in warning_keys:
-                warnings.append(
-                    f"API has pricing for '{api_key}' ({api_value}) - not tracked by LiteLLM"
-                )
-            elif api_key not in api_to_local_mappings:
-                discrepancies.append(
-                    f"Unmapped API pricing key '{api_key}' with value {api_value}"
-                )
-            else:
-                local_key = api_to_local_mappings[api_key]
-                if litellm_params.get(local_key) is None:
-                    discrepancies.append(
-                        f"Missing {local_key}: API has {api_key}={api_value}"
-                    )
+        # Strip "openrouter/" prefix to match API model IDs, then strip
+        # modifiers after ':' as they don't impact pricing
+        api_model_id = model_id[len(_OPENROUTER_PREFIX) :].partition(":")[0]
 
-    return discrepancies, warnings
+        api_model = api_models.get(api_model_id)
+        if api_model is None:
+            discrepancies: List[str] = []
+            warnings: List[str] = []
+            total_issues += 1
+            models_with_issues.add(model_name)
+        else:
+            discrepancies, warnings = compare_pricing(
+                model, api_model, cache_as_warnings=cache_as_warnings
+            )
+            if discrepancies:
+                total_issues += len(discrepancies)
+                models_with_issues.add(model_name)
+            if warnings:
+                total_warnings += len(warnings)
+                models_with_warnings.add(model_name)
+
+        if on_model is not None:
+            on_model(
+                {
+                    "model_name": model_name,
+                    "model_id": model_id,
+                    "api_model_id": api_model_id,
+                    "found": api_model is not None,
+                    "discrepancies": discrepancies,
+                    "warnings": warnings,
+                }
+            )
+
+    return {
+        "total_models": total_models,
+        "models_with_issues": sorted(models_with_issues, key=str),
+        "models_with_warnings": sorted(models_with_warnings, key=str),
+        "total_issues": total_issues,
+        "total_warnings": total_warnings,
+    }
 
 
-def check_model_pricing(
-    config: Dict[str, Any],
-    api_models: Dict[str, Dict[str, Any]],
-    cache_as_warnings: bool = False,
-) -> None:
+def _log_model_result(result: Dict[str, Any]) -> None:
     """
-    Check pricing for all OpenRouter models in config against API data.
+    Log the pricing check results of a single model.
 
     Parameters
     ----------
-    config : Dict[str, Any]
-        Configuration data
-    api_models : Dict[str, Dict[str, Any]]
-        Model data from OpenRouter API
-    cache_as_warnings : bool, optional
-        If True, treat cache-related pricing differences as warnings instead of errors.
-        Default is False.
+    result : Dict[str, Any]
+        Per-model result passed to on_model by build_pricing_report
     """
-    openrouter_models = extract_openrouter_models(config)
+    # Per-model log calls pass their values as arguments rather than f-strings
+    # so loguru only formats them when the level is enabled
+    model_name = result["model_name"]
+    logger.info("Checking model: {} ({})", model_name, result["model_id"])
 
-    if not openrouter_models:
-        logger.info("No OpenRouter models found in config")
+    if not result["found"]:
+        logger.warning("Model {} not found in OpenRouter API", result["api_model_id"])
         return
 
-    total_issues = 0
-    total_warnings = 0
-    models_with_issues = []
-    models_with_warnings = []
+    if result["discrepancies"]:
+        logger.warning("Pricing discrepancies for {}:", model_name)
+        for discrepancy in result["discrepancies"]:
+            logger.warning("  - {}", discrepancy)
 
-    for model in openrouter_models:
-        model_name = model.get("model_name", "Unknown")
-        litellm_params = model.get("litellm_params", {})
-        model_id = litellm_params.get("model", "")
+    if result["warnings"]:
+        logger.info("Pricing warnings for {}:", model_name)
+        for warning in result["warnings"]:
+            logger.info("  - {}", warning)
 
-        # Strip "openrouter/" prefix to match API model IDs
-        api_model_id = model_id.replace("openrouter/", "", 1)
+    if not result["discrepancies"] and not result["warnings"]:
+        logger.success("Pricing is up to date for {}", model_name)
 
-        # Strip modifiers after ':' as they don't impact pricing
-        if ":" in api_model_id:
-            api_model_id = api_model_id.split(":")[0]
 
-        logger.info(f"Checking model: {model_name} ({model_id})")
+def log_pricing_recap(report: Dict[str, Any]) -> None:
+    """
+    Log the recap of a pricing report.
 
-        if api_model_id not in api_models:
-            logger.warning(f"Model {api_model_id} not found in OpenRouter API")
-            total_issues += 1
-            models_with_issues.append(model_name)
-            continue
-
-        api_model = api_models[api_model_id]
-        discrepancies, warnings = compare_pricing(
-            model, api_model, cache_as_warnings=cache_as_warnings
-        )
-
-        has_issues = False
-        if discrepancies:
-            logger.warning(f"Pricing discrepancies for {model_name}:")
-            for discrepancy in discrepancies:
-                logger.warning(f"  - {discrepancy}")
-            total_issues += len(discrepancies)
-            models_with_issues.append(model_name)
-            has_issues = True
-
-        if warnings:
-            logger.info(f"Pricing warnings for {model_name}:")
-            for warning in warnings:
-                logger.info(f"  - {warning}")
-            total_warnings += len(warnings)
-            models_with_warnings.append(model_name)
-            has_issues = True
-
-        if not has_issues:
-            logger.success(f"Pricing is up to date for {model_name}")
+    Parameters
+    ----------
+    report : Dict[str, Any]
+        Report returned by build_pricing_report
+    """
+    if not report["total_models"]:
+        logger.info("No OpenRouter models found in config")
+        return
+
+    logger.info(f"Found {report['total_models']} OpenRouter models in config")
 
     # Print recap summary
     logger.info("=" * 60)
     logger.info("PRICING CHECK RECAP")
     logger.info("=" * 60)
-    logger.info(f"Total models checked: {len(openrouter_models)}")
-    logger.info(f"Models with pricing issues: {len(set(models_with_issues))}")
-    logger.info(f"Models with warnings: {len(set(models_with_warnings))}")
-    logger.info(f"Total pricing issues: {total_issues}")
-    logger.info(f"Total warnings: {total_warnings}")
+    logger.info(f"Total models checked: {report['total_models']}")
+    logger.info(f"Models with pricing issues: {len(report['models_with_issues'])}")
+    logger.info(f"Models with warnings: {len(report['models_with_warnings'])}")
+    logger.info(f"Total pricing issues: {report['total_issues']}")
+    logger.info(f"Total warnings: {report['total_warnings']}")
 
-    if models_with_issues:
+    if report["models_with_issues"]:
         logger.warning("Models requiring pricing fixes:")
-        for model_name in set(models_with_issues):
-            logger.warning(f"  - {model_name}")
+        for model_name in report["models_with_issues"]:
+            logger.warning("  - {}", model_name)
 
-    if models_with_warnings:
+    if report["models_with_warnings"]:
         logger.info("Models with informational warnings:")
-        for model_name in set(models_with_warnings):
-            logger.info(f"  - {model_name}")
+        for model_name in report["models_with_warnings"]:
+            logger.info("  - {}", model_name)
 
-    if total_issues > 0:
-        logger.error(f"Found {total_issues} pricing issues total")
-        sys.exit(1)
+
+def write_json_report(report: Dict[str, Any]) -> None:
+    """
+    Write a report to stdout as a single indented JSON document.
+
+    Parameters
+    ----------
+    report : Dict[str, Any]
+        Report data to serialize
+    """
+    try:
+        import orjson
+    except ImportError:
+        sys.stdout.write(json.dumps(report, indent=2) + "\n")
+        sys.stdout.flush()
+        return
+
+    data = orjson.dumps(report, option=orjson.OPT_INDENT_2) + b"\n"
+    # stdout may have been replaced by a text-only stream without a buffer
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
     else:
-        logger.success("All OpenRouter model pricing is up to date!")
+        sys.stdout.flush()
+        buffer.write(data)
+    sys.stdout.flush()
+
+
+def check_model_pricing(
+    config: Dict[str, Any],
+    api_models: Dict[str, Dict[str, Any]],
+    cache_as_warnings: bool = False,
+) -> int:
+    """
+    Check pricing for all OpenRouter models in config and log the results.
+
+    Each model is logged as soon as it is checked, followed by a recap. The
+    exit code is left to the caller, which gets the number of issues found.
+
+    Parameters
+    ----------
+    config : Dict[str, Any]
+        Configuration data
+    api_models : Dict[str, Dict[str, Any]]
+        Model data from OpenRouter API
+    cache_as_warnings : bool, optional
+        If True, treat cache-related pricing differences as warnings instead of errors.
+        Default is False.
+
+    Returns
+    -------
+    int
+        Number of pricing issues found
+    """
+    report = build_pricing_report(
+        config,
+        api_models,
+        cache_as_warnings=cache_as_warnings,
+        on_model=_log_model_result,
+    )
+    log_pricing_recap(report)
+    return report["total_issues"]
 
 
 @click.command()
 @click.option(
     "--config",
     required=True,
+    multiple=True,
     type=click.Path(exists=True),
-    help="Path to the YAML configuration file",
+    help="Path to the YAML configuration file, can be given multiple times",
 )
 @click.option(
     "--cache-as-warnings",
@@ -319,29 +538,83 @@ def check_model_pricing(
     default=False,
     help="Treat cache-related pricing differences as warnings instead of errors",
 )
-def main(config: str, cache_as_warnings: bool) -> None:
+@click.option(
+    "--log-format",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Report results as log lines, or as one JSON document on stdout",
+)
+def main(config: Tuple[str, ...], cache_as_warnings: bool, log_format: str) -> None:
     """
     Update OpenRouter model pricing in LiteLLM proxy configuration.
 
     This script compares local pricing configuration with OpenRouter API
     pricing and reports any discrepancies or missing values.
     """
+    import requests
+    import yaml
+
     logger.info("Starting OpenRouter price updater")
 
     try:
-        # Load configuration
-        logger.info(f"Loading config from: {config}")
-        config_data = load_config(config)
+        # Fetch API data in a daemon thread while the configs are loaded, so an
+        # invalid config still exits right away instead of waiting on the fetch
+        fetch_result: Dict[str, Any] = {}
+
+        def fetch() -> None:
+            try:
+                fetch_result["models"] = fetch_openrouter_models()
+            except Exception as e:
+                fetch_result["error"] = e
 
-        # Fetch API data
         logger.info("Fetching models from OpenRouter API...")
-        api_models = fetch_openrouter_models()
+        fetch_thread = threading.Thread(target=fetch, daemon=True)
+        fetch_thread.start()
+
+        # Repeated paths are only loaded and checked once
+        configs = {}
+        for config_path in config:
+            if config_path not in configs:
+                logger.info(f"Loading config from: {config_path}")
+                configs[config_path] = load_config(config_path)
+
+        fetch_thread.join()
+        if "error" in fetch_result:
+            raise fetch_result["error"]
+        api_models = fetch_result["models"]
+
+        # Check pricing, sharing the API data across all configs
+        pretty = log_format == "pretty"
+        total_issues = 0
+        reports = []
+        for config_path, config_data in configs.items():
+            logger.info(
+                f"Comparing local pricing with API pricing for {config_path}..."
+            )
+            if pretty:
+                total_issues += check_model_pricing(
+                    config_data, api_models, cache_as_warnings=cache_as_warnings
+                )
+            else:
+                models: List[Dict[str, Any]] = []
+                report = build_pricing_report(
+                    config_data,
+                    api_models,
+                    cache_as_warnings=cache_as_warnings,
+                    on_model=models.append,
+                )
+                total_issues += report["total_issues"]
+                reports.append({"config": config_path, "models": models, **report})
 
-        # Check pricing
-        logger.info("Comparing local pricing with API pricing...")
-        check_model_pricing(
-            config_data, api_models, cache_as_warnings=cache_as_warnings
-        )
+        if not pretty:
+            write_json_report({"configs": reports, "total_issues": total_issues})
+
+        if total_issues > 0:
+            logger.error(f"Found {total_issues} pricing issues total")
+            sys.exit(1)
+        else:
+            logger.success("All OpenRouter model pricing is up to date!")
 
     except (FileNotFoundError, yaml.YAMLError, requests.RequestException) as e:
         logger.error(f"Error: {e}")
@@ -0,0 +1,132 @@
+"""
+OpenRouter pricing comparison for the LiteLLM Proxy OpenRouter Price Updater.
+
+This module holds the per-model comparison logic, kept free of I/O and CLI
+code so that it can optionally be compiled with mypyc (see setup.py).
+"""
+
+import math
+from types import MappingProxyType
+from typing import Any, Dict, List, Tuple
+
+# Mapping of local keys to API keys
+_PRICE_MAPPINGS = MappingProxyType(
+    {
+        "input_cost_per_token": "prompt",
+        "output_cost_per_token": "completion",
+        "cache_creation_input_token_cost": "input_cache_write",
+        "cache_read_input_token_cost": "input_cache_read",
+        "input_cost_per_image": "image",
+        "output_cost_per_reasoning_token": "internal_reasoning",
+    }
+)
+
+# Reverse mapping to check for unmapped API keys
+_API_TO_LOCAL = MappingProxyType({v: k for k, v in _PRICE_MAPPINGS.items()})
+
+# Pricing keys that generate warnings instead of discrepancies
+# These are not tracked by LiteLLM as of September 2025
+_WARNING_KEYS = frozenset({"web_search"})
+
+# Cache-related API keys that can optionally be treated as warnings
+_CACHE_API_KEYS = frozenset({"input_cache_write", "input_cache_read"})
+_WARNING_KEYS_WITH_CACHE = _WARNING_KEYS | _CACHE_API_KEYS
+
+
+def _to_float(value: Any) -> float:
+    """
+    Convert a price to float, returning floats unchanged.
+
+    OpenRouter returns prices as strings while configs usually hold floats,
+    so the exact type check skips a needless conversion for the latter.
+
+    Parameters
+    ----------
+    value : Any
+        Price as a float, int or numeric string
+
+    Returns
+    -------
+    float
+        The price as a float
+    """
+    return value if type(value) is float else float(value)
+
+
+def compare_pricing(
+    local_model: Dict[str, Any],
+    api_model: Dict[str, Any],
+    cache_as_warnings: bool = False,
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare local model pricing with API pricing.
+
+    Parameters
+    ----------
+    local_model : Dict[str, Any]
+        Local model configuration
+    api_model : Dict[str, Any]
+        Model data from OpenRouter API
+    cache_as_warnings : bool, optional
+        If True, treat cache-related pricing differences as warnings instead of errors.
+        Default is False.
+
+    Returns
+    -------
+    Tuple[List[str], List[str]]
+        Tuple of (discrepancies, warnings) found
+    """
+    discrepancies = []
+    warnings = []
+    litellm_params = local_model.get("litellm_params", {})
+    api_pricing = api_model.get("pricing", {})
+
+    for local_key, api_key in _PRICE_MAPPINGS.items():
+        local_value = litellm_params.get(local_key)
+        api_value = api_pricing.get(api_key)
+
+        if local_value is None:
+            if api_value and _to_float(api_value) > 0:
+                discrepancies.append(f"Missing {local_key}: should be {api_value}")
+        else:
+            if api_value is None:
+                discrepancies.append(
+                    f"{local_key} set to {local_value} but API has no {api_key}"
+                )
+            else:
+                local_float = _to_float(local_value)
+                api_float = _to_float(api_value)
+
+                # Combine a relative tolerance, which scales with the price, with
+                # a tiny absolute one so sub-microcent prices still compare sanely
+                if not math.isclose(
+                    local_float, api_float, rel_tol=1e-9, abs_tol=1e-12
+                ):
+                    discrepancies.append(
+                        f"{local_key} mismatch: local={local_value}, API={api_value}"
+                    )
+
+    # If cache_as_warnings is enabled, cache keys also generate warnings
+    warning_keys = _WARNING_KEYS_WITH_CACHE if cache_as_warnings else _WARNING_KEYS
+
+    # Check for API pricing keys that have non-zero values but are missing from config.
+    # Mapped keys were all handled above, so only warning and unmapped keys are
+    # left. They are split with set operations on the dict views, and sorted
+    # so the output order does not depend on string hashing.
+    api_keys = api_pricing.keys()
+
+    for api_key in sorted(api_keys & warning_keys):
+        api_value = api_pricing[api_key]
+        if api_value and _to_float(api_value) > 0:
+            warnings.append(
+                f"API has pricing for '{api_key}' ({api_value}) - not tracked by LiteLLM"
+            )
+
+    for api_key in sorted(api_keys - _API_TO_LOCAL.keys() - warning_keys):
+        api_value = api_pricing[api_key]
+        if api_value and _to_float(api_value) > 0:
+            discrepancies.append(
+                f"Unmapped API pricing key '{api_key}' with value {api_value}"
+            )
+
+    return discrepancies, warnings
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Optional build script compiling openrouter_pricing.py with mypyc.
+
+The script runs fine without this step. To build the C extension in place:
+
+    pip install mypy setuptools
+    python setup.py build_ext --inplace
+
+Python imports the compiled extension instead of openrouter_pricing.py when
+both are present, so no other change is needed. Delete the generated .so file
+to go back to the pure Python version. Without mypy installed, this falls
+back to a plain pure Python setup.
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = mypycify(["openrouter_pricing.py"])
+
+setup(
+    name="litellm_proxy_openrouter_price_updater",
+    py_modules=["litellm_proxy_openrouter_price_updater", "openrouter_pricing"],
+    ext_modules=ext_modules,
+)